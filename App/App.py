@@ -1,7 +1,23 @@
+import time
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import streamlit as st
 import mysql.connector
 import plotly.express as px
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import combinations
+from sqlalchemy import text
+from sqlalchemy.engine import URL
+from sqlalchemy.exc import SQLAlchemyError
+
+# Optional: connectorx reads MySQL results straight into Arrow columns
+try:
+    import connectorx as cx
+    CONNECTORX_AVAILABLE = True
+except ImportError:
+    CONNECTORX_AVAILABLE = False
 
 import pandas as pd
 import streamlit as st
@@ -9,47 +25,218 @@ import mysql.connector
 import plotly.express as px
 
 # ---------------- Database Connection ----------------
+POOL_SIZE = 10
+
+def get_sql_connection():
+    """Streamlit SQL connection built from the MySQL secrets.
+
+    st.connection caches it, and its engine and connection pool, once per process.
+    Only the engine is used: conn.query() binds :name parameters while the
+    app's SQL uses %s, so results are cached by run_query_cached and the
+    other st.cache_data readers, which clear_query_cache() can target.
+    """
+    url = URL.create(
+        "mysql+mysqlconnector",
+        username=st.secrets["mysql"]["user"],
+        password=st.secrets["mysql"]["password"],
+        host=st.secrets["mysql"]["host"],
+        port=int(st.secrets["mysql"]["port"]),
+        database=st.secrets["mysql"]["database"]
+    )
+    # Recycle connections before server-side idle timeouts can drop them
+    return st.connection(
+        "mysql", type="sql",
+        url=url.render_as_string(hide_password=False),
+        pool_size=POOL_SIZE, pool_pre_ping=True, pool_recycle=1800
+    )
+
+def get_engine():
+    """SQLAlchemy engine behind the shared SQL connection."""
+    return get_sql_connection().engine
+
 def get_db_connection():
-    """Establish a database connection using Streamlit secrets."""
+    """Borrow a DB-API connection from the engine pool; close() returns it to the pool."""
     try:
-        return mysql.connector.connect(
-            host=st.secrets["mysql"]["host"],
-            user=st.secrets["mysql"]["user"],
-            password=st.secrets["mysql"]["password"],
-            database=st.secrets["mysql"]["database"],
-            port=st.secrets["mysql"]["port"]
-        )
-    except mysql.connector.Error as err:
+        return get_engine().raw_connection()
+    except (mysql.connector.Error, SQLAlchemyError) as err:
         st.error(f"Database connection error: {err}")
         return None
 
 # ---------------- Test Database Connection ----------------
+@st.cache_data(ttl=60, show_spinner=False)
+def _check_db_connection():
+    """Borrow a pooled connection and give it back; only successes are cached, for a minute.
+
+    Errors are raised instead of returned so that failures are never cached.
+    """
+    get_engine().raw_connection().close()
+    return True
+
 def test_db_connection():
     """Test if database connection is working."""
-    conn = get_db_connection()
-    if conn:
-        conn.close()
-        return True
-    return False
+    try:
+        return _check_db_connection()
+    except (mysql.connector.Error, SQLAlchemyError) as err:
+        st.error(f"Database connection error: {err}")
+        return False
 
 # ---------------- Run SQL Query ----------------
+def _read_sql(query, params=None, engine=None):
+    """Run an SQL query on a pooled connection.
+
+    Worker threads have no Streamlit script context, so they must pass an
+    engine resolved on the script thread instead of calling get_engine().
+    """
+    with (engine or get_engine()).connect() as conn:
+        return pd.read_sql(query, conn, params=params, dtype_backend="pyarrow")
+
+# Half the pool, so one fan-out never holds every connection other sessions need
+QUERY_WORKERS = max(1, POOL_SIZE // 2)
+
+def _read_sql_safely(engine, name, query):
+    """Worker for run_queries_concurrently: return the DataFrame, or None if the query fails."""
+    try:
+        return _read_sql(query, engine=engine)
+    except Exception as e:
+        print(f"Error in query '{name}': {str(e)}")
+        return None
+
+def run_queries_concurrently(queries):
+    """Run independent {name: SQL} queries in parallel over the connection pool.
+
+    Wall-clock time is the slowest query rather than the sum; returns
+    {name: DataFrame}, with None for queries that failed. Callers that cache
+    the result must not keep a dict containing failures.
+    """
+    if not queries:
+        return {}
+    # Resolve st.connection and its secrets here, on the script thread
+    engine = get_engine()
+    with ThreadPoolExecutor(max_workers=min(QUERY_WORKERS, len(queries))) as executor:
+        results = executor.map(partial(_read_sql_safely, engine), queries, queries.values())
+        return dict(zip(queries, results))
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def run_query_cached(query, params=None):
+    """Run an SQL query and cache the resulting DataFrame.
+
+    Errors are raised instead of returned so that failures are never cached.
+    """
+    return _read_sql(query, params)
+
 def run_query(query, params=None):
     """Run an SQL query and return a DataFrame."""
-    conn = get_db_connection()
-    if not conn:
-        return pd.DataFrame()
-    
     try:
-        df = pd.read_sql(query, conn, params=params)
-        return df
+        return run_query_cached(query, tuple(params) if params else None)
     except Exception as e:
         st.error(f"Query execution failed: {e}")
         return pd.DataFrame()
-    finally:
-        conn.close()
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def run_arrow_query_cached(query):
+    """Run a parameterless SELECT through connectorx and cache the Arrow-backed DataFrame."""
+    url = get_engine().url.set(drivername="mysql").render_as_string(hide_password=False)
+    table = cx.read_sql(url, query, return_type="arrow")
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+@st.cache_resource
+def _connectorx_state():
+    """Process-wide flag, switched off after the first connectorx failure."""
+    return {"usable": CONNECTORX_AVAILABLE}
+
+def run_arrow_query(query):
+    """Run a parameterless SELECT via connectorx, falling back to run_query without it."""
+    state = _connectorx_state()
+    if state["usable"]:
+        try:
+            return run_arrow_query_cached(query)
+        except Exception as e:
+            # Don't pay a failed connect on every later cache miss
+            print(f"connectorx read failed, using pandas for the rest of this process: {e}")
+            state["usable"] = False
+    return run_query(query)
+
+@st.cache_resource
+def _data_version():
+    """Process-wide counter, bumped whenever cached query results are dropped."""
+    return {"value": 0}
+
+def clear_query_cache():
+    """Drop cached query results so the next read sees fresh data.
+
+    Only the readers of table data are cleared; charts and the connection
+    check stay cached.
+    """
+    _data_version()["value"] += 1
+    for cached_reader in (run_query_cached, run_arrow_query_cached, load_table_page,
+                          all_analyses_cached, load_contacts_cached):
+        cached_reader.clear()
 
 
 # ---------------- CRUD Operations ----------------
+# Table configuration
+# Columns follow the Datasets/ CSVs the database is loaded from: Receivers has
+# Type and no Address, and the Claims date column is Timestamp (not Claim_Date)
+TABLE_FIELDS = {
+    "Food_Listings": ["Food_ID", "Food_Name", "Quantity", "Expiry_Date", "Provider_ID", "Provider_Type", "Location", "Food_Type", "Meal_Type"],
+    "Providers": ["Provider_ID", "Name", "Type", "Contact", "Address", "City"],
+    "Receivers": ["Receiver_ID", "Name", "Type", "Contact", "City"],
+    "Claims": ["Claim_ID", "Food_ID", "Receiver_ID", "Status", "Timestamp"]
+}
+
+PRIMARY_KEYS = {
+    "Food_Listings": "Food_ID",
+    "Providers": "Provider_ID",
+    "Receivers": "Receiver_ID",
+    "Claims": "Claim_ID"
+}
+
+# Free-text date-time columns, parsed and normalized before they are written
+TIMESTAMP_FIELDS = {
+    "Claims": ("Timestamp",)
+}
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def _parse_timestamps(table_name, inputs):
+    """Normalize the table's timestamp inputs in place to TIMESTAMP_FORMAT.
+
+    Accepts e.g. 2025-03-05 05:26 or the CSVs' 3/5/2025 5:26; returns the
+    first column that does not parse, or None when all are valid.
+    """
+    for col in TIMESTAMP_FIELDS.get(table_name, ()):
+        if col in inputs:
+            parsed = pd.to_datetime(inputs[col], errors="coerce", format="mixed")
+            if pd.isna(parsed):
+                return col
+            inputs[col] = parsed.strftime(TIMESTAMP_FORMAT)
+    return None
+
+def _build_write_statements():
+    """Pre-build INSERT/UPDATE statements for every subset of each table's fields.
+
+    Keyed by table and frozenset of column names, each entry holds the SQL and
+    the column order its placeholders expect. Column names outside
+    TABLE_FIELDS have no entry, so lookups double as a whitelist.
+    """
+    inserts, updates = {}, {}
+    for table, fields in TABLE_FIELDS.items():
+        pk = PRIMARY_KEYS[table]
+        inserts[table], updates[table] = {}, {}
+        for r in range(1, len(fields) + 1):
+            for cols in combinations(fields, r):
+                inserts[table][frozenset(cols)] = (
+                    f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join(['%s'] * r)})",
+                    cols
+                )
+                if pk not in cols:
+                    updates[table][frozenset(cols)] = (
+                        f"UPDATE {table} SET {', '.join(f'{c}=%s' for c in cols)} WHERE {pk}=%s",
+                        cols
+                    )
+    return inserts, updates
+
+_INSERT_SQL, _UPDATE_SQL = _build_write_statements()
+
 def create_record(table_name, inputs):
     """Generic create function for any table"""
     try:
@@ -62,15 +249,22 @@ def create_record(table_name, inputs):
         if not filtered_inputs:
             st.warning("No data to insert")
             return
-            
-        columns = ", ".join(filtered_inputs.keys())
-        placeholders = ", ".join(["%s"] * len(filtered_inputs))
-        values = tuple(filtered_inputs.values())
         
-        query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+        invalid_col = _parse_timestamps(table_name, filtered_inputs)
+        if invalid_col:
+            st.error(f"Invalid {invalid_col}: use a date and time such as 2025-03-05 05:26")
+            return
+            
+        statement = _INSERT_SQL[table_name].get(frozenset(filtered_inputs))
+        if statement is None:
+            st.error(f"Unknown columns for {table_name}")
+            return
+        query, columns = statement
+        values = tuple(filtered_inputs[col] for col in columns)
         
         cursor.execute(query, values)
         conn.commit()
+        clear_query_cache()
         st.success(f"Record created successfully in {table_name}")
     except mysql.connector.Error as e:
         st.error(f"Error creating record: {e}")
@@ -79,7 +273,50 @@ def create_record(table_name, inputs):
     finally:
         if 'cursor' in locals():
             cursor.close()
-        if 'conn' in locals():
+        if 'conn' in locals() and conn:
+            conn.close()
+
+def create_records(table_name, df):
+    """Bulk create: insert every row of a DataFrame in one transaction"""
+    try:
+        if df is None or df.empty:
+            st.warning("No data to insert")
+            return
+
+        statement = _INSERT_SQL[table_name].get(frozenset(df.columns))
+        if statement is None:
+            st.error(f"Unknown columns for {table_name}")
+            return
+        query, columns = statement
+
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        for col in TIMESTAMP_FIELDS.get(table_name, ()):
+            if col in df.columns:
+                parsed = pd.to_datetime(df[col], errors="coerce", format="mixed")
+                invalid = parsed.isna() & df[col].notna()
+                if invalid.any():
+                    st.error(f"Invalid {col} in {invalid.sum()} row(s): use a date and time such as 2025-03-05 05:26")
+                    return
+                df = df.assign(**{col: parsed.dt.strftime(TIMESTAMP_FORMAT)})
+
+        # Plain Python values with NULL for missing cells, in statement column order
+        df = df[list(columns)]
+        rows = list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+        cursor.executemany(query, rows)
+        conn.commit()
+        clear_query_cache()
+        st.success(f"{len(rows)} records created successfully in {table_name}")
+    except mysql.connector.Error as e:
+        st.error(f"Error creating records: {e}")
+    except Exception as e:
+        st.error(f"Unexpected error: {e}")
+    finally:
+        if 'cursor' in locals():
+            cursor.close()
+        if 'conn' in locals() and conn:
             conn.close()
 
 def update_record(table_name, record_id, inputs):
@@ -88,14 +325,7 @@ def update_record(table_name, record_id, inputs):
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Get primary key for the table
-        primary_keys = {
-            "Food_Listings": "Food_ID",
-            "Providers": "Provider_ID", 
-            "Receivers": "Receiver_ID",
-            "Claims": "Claim_ID"
-        }
-        pk = primary_keys[table_name]
+        pk = PRIMARY_KEYS[table_name]
         
         # Filter out empty values
         filtered_inputs = {k: v for k, v in inputs.items() if v not in [None, "", 0]}
@@ -104,13 +334,21 @@ def update_record(table_name, record_id, inputs):
             st.warning("No fields to update")
             return
         
-        set_clause = ", ".join([f"{k}=%s" for k in filtered_inputs.keys()])
-        values = list(filtered_inputs.values()) + [record_id]
+        invalid_col = _parse_timestamps(table_name, filtered_inputs)
+        if invalid_col:
+            st.error(f"Invalid {invalid_col}: use a date and time such as 2025-03-05 05:26")
+            return
         
-        query = f"UPDATE {table_name} SET {set_clause} WHERE {pk}=%s"
+        statement = _UPDATE_SQL[table_name].get(frozenset(filtered_inputs))
+        if statement is None:
+            st.error(f"Unknown columns for {table_name}")
+            return
+        query, columns = statement
+        values = [filtered_inputs[col] for col in columns] + [record_id]
         
         cursor.execute(query, values)
         conn.commit()
+        clear_query_cache()
         if cursor.rowcount > 0:
             st.success(f"Record {record_id} updated successfully")
         else:
@@ -122,30 +360,49 @@ def update_record(table_name, record_id, inputs):
     finally:
         if 'cursor' in locals():
             cursor.close()
-        if 'conn' in locals():
+        if 'conn' in locals() and conn:
             conn.close()
 
+@st.cache_data(ttl=600, show_spinner=False)
+def _claims_cascade_cached():
+    """Look up whether the Claims -> Food_Listings foreign key cascades deletes.
+
+    Errors are raised instead of returned so that failures are never cached.
+    """
+    df = _read_sql("""
+        SELECT COUNT(*) AS Cascading_Keys
+        FROM information_schema.REFERENTIAL_CONSTRAINTS
+        WHERE CONSTRAINT_SCHEMA = DATABASE()
+          AND TABLE_NAME = 'Claims'
+          AND REFERENCED_TABLE_NAME = 'Food_Listings'
+          AND DELETE_RULE = 'CASCADE'
+    """)
+    return bool(df.iloc[0, 0])
+
+def claims_cascade_enabled():
+    """Whether sql/001_claims_fk_cascade.sql has been applied; False if it cannot be checked."""
+    try:
+        return _claims_cascade_cached()
+    except Exception as e:
+        print(f"Could not check the Claims foreign key: {e}")
+        return False
+
 def delete_record(table_name, record_id):
     """Generic delete function for any table"""
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Get primary key for the table
-        primary_keys = {
-            "Food_Listings": "Food_ID",
-            "Providers": "Provider_ID",
-            "Receivers": "Receiver_ID", 
-            "Claims": "Claim_ID"
-        }
-        pk = primary_keys[table_name]
+        pk = PRIMARY_KEYS[table_name]
         
-        # Handle foreign key constraints for Food_Listings
-        if table_name == "Food_Listings":
+        # Handle foreign key constraints for Food_Listings, unless the database
+        # already cascades them (sql/001_claims_fk_cascade.sql)
+        if table_name == "Food_Listings" and not claims_cascade_enabled():
             cursor.execute("DELETE FROM Claims WHERE Food_ID=%s", (record_id,))
         
         cursor.execute(f"DELETE FROM {table_name} WHERE {pk}=%s", (record_id,))
         conn.commit()
+        clear_query_cache()
         
         if cursor.rowcount > 0:
             st.success(f"Record {record_id} deleted successfully from {table_name}")
@@ -158,329 +415,499 @@ def delete_record(table_name, record_id):
     finally:
         if 'cursor' in locals():
             cursor.close()
-        if 'conn' in locals():
+        if 'conn' in locals() and conn:
             conn.close()
 
 # ---------------- Fetch Table Data ----------------
-def fetch_table_data(table_name):
-    query = f"SELECT * FROM {table_name}"
-    return run_query(query)
+TABLE_PAGE_SIZE = 500
+
+def fetch_table_data(table_name, limit=5000, offset=0):
+    """Fetch one page of a table instead of materializing all of it."""
+    # TABLE_FIELDS lists every column today, so this reads what SELECT * would;
+    # it keeps Tab 2 to the declared columns if wide ones are added later.
+    # Ordered by primary key so pages are deterministic and don't overlap.
+    # LIMIT/OFFSET are inlined as ints: connectorx takes no bind parameters
+    query = (
+        f"SELECT {', '.join(TABLE_FIELDS[table_name])} FROM {table_name} "
+        f"ORDER BY {PRIMARY_KEYS[table_name]} LIMIT {int(limit)} OFFSET {int(offset)}"
+    )
+    return run_arrow_query(query)
+
+def fetch_filtered_table_data(table_name, text_filters, range_filters, limit=5000):
+    """Fetch only the rows matching the Tab 2 filters, filtered by the database.
+
+    text_filters maps column -> substring (case-insensitive match),
+    range_filters maps column -> (low, high) inclusive bounds.
+    """
+    conditions, params = [], []
+    for col, val in text_filters.items():
+        pattern = val.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        conditions.append(f"LOWER(`{col}`) LIKE %s")
+        params.append(f"%{pattern}%")
+    for col, (low, high) in range_filters.items():
+        conditions.append(f"`{col}` BETWEEN %s AND %s")
+        params.extend([low, high])
+
+    query = f"SELECT {', '.join(TABLE_FIELDS[table_name])} FROM {table_name}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += f" ORDER BY {PRIMARY_KEYS[table_name]} LIMIT %s"
+    params.append(int(limit))
+    return run_query(query, tuple(params))
+
+def filter_table_data(df, text_filters, range_filters):
+    """Apply the Tab 2 filters to an already loaded DataFrame.
+
+    All conditions are combined into one boolean mask so the frame is
+    indexed once, however many filters are active.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for col, val in text_filters.items():
+        mask &= df[col].str.contains(val, case=False, regex=False, na=False).to_numpy(dtype=bool)
+    for col, (low, high) in range_filters.items():
+        mask &= df[col].between(low, high).to_numpy(dtype=bool, na_value=False)
+    return df[mask]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_table_page(table_name, offset=0):
+    """Fetch one TABLE_PAGE_SIZE page of a table, starting at row `offset`."""
+    return fetch_table_data(table_name, limit=TABLE_PAGE_SIZE, offset=offset)
+
+def build_table_view(df, last_page):
+    """Bundle the loaded rows of a table with the filter metadata Tab 2 needs.
+
+    Returns the DataFrame, a {column: (min, max)} map for numeric columns,
+    the list of text columns and whether the server may hold more rows.
+    """
+    has_more = len(last_page) == TABLE_PAGE_SIZE
+    if df.empty:
+        return df, {}, [], has_more
+    num_cols = list(df.select_dtypes("number").columns)
+    num_ranges = {}
+    if num_cols:
+        # One aggregation over all numeric columns instead of a min and a max scan per column
+        stats = df[num_cols].agg(["min", "max"])
+        num_ranges = {col: (int(stats.at["min", col]), int(stats.at["max", col])) for col in num_cols}
+    obj_cols = [col for col in df.columns if pd.api.types.is_string_dtype(df[col])]
+    return df, num_ranges, obj_cols, has_more
     
 #------------------ Analysis queries ---------------
-def analysis_query(option, param=None):
-    """Run analysis queries and return dataframe + optional figure - Cloud Compatible Version"""
-    
-    # Import with error handling for cloud environments
-    try:
-        import plotly.express as px
-        import plotly.graph_objects as go
-        import pandas as pd
-        PLOTLY_AVAILABLE = True
-    except ImportError as e:
-        print(f"Plotly not available: {e}")
-        PLOTLY_AVAILABLE = False
-    
-    queries = {
-        "Providers & Receivers by City": """
-            SELECT City,
-                   (SELECT COUNT(*) FROM Providers p2 WHERE p2.City = p.City) AS Providers_Count,
-                   (SELECT COUNT(*) FROM Receivers r WHERE r.City = p.City) AS Receivers_Count
-            FROM Providers p
-            GROUP BY City;
-        """,
-        "Top Food Provider Type by Quantity": """
-            SELECT Type, SUM(f.Quantity) AS Total_Quantity
-            FROM Providers p
-            JOIN Food_Listings f ON p.Provider_ID=f.Provider_ID
-            GROUP BY Type
-            ORDER BY Total_Quantity DESC
-            LIMIT 5;
-        """,
-        "Provider Contact Info by City": """
-            SELECT Name, Contact, Address
-            FROM Providers
-            WHERE City = %s;
-        """,
-        "Top Receivers by Claimed Food": """
-            SELECT r.Name, r.Contact, SUM(f.Quantity) AS Total_Claimed
-            FROM Receivers r
-            JOIN Claims c ON r.Receiver_ID=c.Receiver_ID
-            JOIN Food_Listings f ON c.Food_ID=f.Food_ID
-            GROUP BY r.Receiver_ID, r.Name, r.Contact
-            ORDER BY Total_Claimed DESC
-            LIMIT 10;
-        """,
-        "Total Food Quantity Available": "SELECT SUM(Quantity) AS Total_Food_Quantity FROM Food_Listings;",
-        "City with Most Food Listings": """
-            SELECT p.City, COUNT(*) AS Listings_Count
-            FROM Providers p
-            JOIN Food_Listings f ON p.Provider_ID = f.Provider_ID
-            GROUP BY p.City
-            ORDER BY Listings_Count DESC
-            LIMIT 1;
-        """,
-        "Top Food Types Available": """
-            SELECT Food_Type, COUNT(*) AS Count
-            FROM Food_Listings
-            GROUP BY Food_Type
-            ORDER BY Count DESC
-            LIMIT 5;
-        """,
-        "Claims Count per Food Item": """
-            SELECT f.Food_Name, COUNT(*) AS Claims_Count
-            FROM Food_Listings f
-            JOIN Claims c ON f.Food_ID = c.Food_ID
-            GROUP BY f.Food_ID, f.Food_Name
-            ORDER BY Claims_Count DESC;
-        """,
-        "Top Provider by Successful Claims": """
-            SELECT p.Name, COUNT(*) AS Successful_Claims
-            FROM Providers p
-            JOIN Food_Listings f ON p.Provider_ID = f.Provider_ID
-            JOIN Claims c ON f.Food_ID = c.Food_ID
-            WHERE c.Status = 'Completed'
-            GROUP BY p.Provider_ID, p.Name
-            ORDER BY Successful_Claims DESC
-            LIMIT 1;
-        """,
-        "Claims Status Percentage": """
-            SELECT Status, 
-                   COUNT(*) AS Count,
-                   ROUND(100.0 * COUNT(*) / (SELECT COUNT(*) FROM Claims), 2) AS Percentage
+# Import with error handling for cloud environments
+try:
+    import plotly.express as px
+    import plotly.graph_objects as go
+    PLOTLY_AVAILABLE = True
+except ImportError as e:
+    print(f"Plotly not available: {e}")
+    PLOTLY_AVAILABLE = False
+
+_QUERIES = {
+    "Providers & Receivers by City": """
+        SELECT p.City,
+               p.Providers_Count,
+               COALESCE(r.Receivers_Count, 0) AS Receivers_Count
+        FROM (SELECT City, COUNT(*) AS Providers_Count FROM Providers GROUP BY City) p
+        LEFT JOIN (SELECT City, COUNT(*) AS Receivers_Count FROM Receivers GROUP BY City) r
+            ON p.City = r.City;
+    """,
+    "Top Food Provider Type by Quantity": """
+        SELECT Type, SUM(f.Quantity) AS Total_Quantity
+        FROM Providers p
+        JOIN Food_Listings f ON p.Provider_ID=f.Provider_ID
+        GROUP BY Type
+        ORDER BY Total_Quantity DESC
+        LIMIT 5;
+    """,
+    "Provider Contact Info by City": """
+        SELECT Name, Contact, Address
+        FROM Providers
+        WHERE City = %s;
+    """,
+    "Top Receivers by Claimed Food": """
+        SELECT r.Name, r.Contact, SUM(f.Quantity) AS Total_Claimed
+        FROM Receivers r
+        JOIN Claims c ON r.Receiver_ID=c.Receiver_ID
+        JOIN Food_Listings f ON c.Food_ID=f.Food_ID
+        GROUP BY r.Receiver_ID, r.Name, r.Contact
+        ORDER BY Total_Claimed DESC
+        LIMIT 10;
+    """,
+    "Total Food Quantity Available": "SELECT SUM(Quantity) AS Total_Food_Quantity FROM Food_Listings;",
+    "City with Most Food Listings": """
+        SELECT p.City, COUNT(*) AS Listings_Count
+        FROM Providers p
+        JOIN Food_Listings f ON p.Provider_ID = f.Provider_ID
+        GROUP BY p.City
+        ORDER BY Listings_Count DESC
+        LIMIT 1;
+    """,
+    "Top Food Types Available": """
+        SELECT Food_Type, COUNT(*) AS Count
+        FROM Food_Listings
+        GROUP BY Food_Type
+        ORDER BY Count DESC
+        LIMIT 5;
+    """,
+    "Claims Count per Food Item": """
+        SELECT f.Food_Name, COUNT(*) AS Claims_Count
+        FROM Food_Listings f
+        JOIN Claims c ON f.Food_ID = c.Food_ID
+        GROUP BY f.Food_ID, f.Food_Name
+        ORDER BY Claims_Count DESC;
+    """,
+    "Top Provider by Successful Claims": """
+        WITH completed AS (
+            SELECT Food_ID, COUNT(*) AS Claims
             FROM Claims
-            GROUP BY Status;
-        """,
-        "Avg Quantity Claimed per Receiver": """
-            SELECT r.Name, AVG(CAST(f.Quantity AS FLOAT)) AS Avg_Quantity_Claimed
-            FROM Receivers r
-            JOIN Claims c ON r.Receiver_ID = c.Receiver_ID
-            JOIN Food_Listings f ON c.Food_ID = f.Food_ID
-            GROUP BY r.Receiver_ID, r.Name
-            ORDER BY Avg_Quantity_Claimed DESC;
-        """,
-        "Most Claimed Meal Type": """
-            SELECT f.Meal_Type, COUNT(*) AS Claims_Count
-            FROM Food_Listings f
-            JOIN Claims c ON f.Food_ID = c.Food_ID
-            GROUP BY f.Meal_Type
-            ORDER BY Claims_Count DESC;
-        """,
-        "Total Food Donated by Provider": """
-            SELECT p.Name, SUM(f.Quantity) AS Total_Quantity_Donated
-            FROM Providers p
-            JOIN Food_Listings f ON p.Provider_ID = f.Provider_ID
+            WHERE Status = 'Completed'
+            GROUP BY Food_ID
+        ),
+        ranked AS (
+            SELECT p.Name,
+                   CAST(SUM(c.Claims) AS SIGNED) AS Successful_Claims,
+                   ROW_NUMBER() OVER (ORDER BY SUM(c.Claims) DESC) AS rn
+            FROM completed c
+            JOIN Food_Listings f ON f.Food_ID = c.Food_ID
+            JOIN Providers p ON p.Provider_ID = f.Provider_ID
             GROUP BY p.Provider_ID, p.Name
-            ORDER BY Total_Quantity_Donated DESC;
-        """,
-        "Top Cities by Claimed Food Quantity": """
-            SELECT p.City, SUM(f.Quantity) AS Total_Claimed
-            FROM Providers p
-            JOIN Food_Listings f ON p.Provider_ID = f.Provider_ID
-            JOIN Claims c ON f.Food_ID = c.Food_ID
-            WHERE c.Status='Completed'
+        )
+        SELECT Name, Successful_Claims
+        FROM ranked
+        WHERE rn = 1;
+    """,
+    "Claims Status Percentage": """
+        SELECT Status, 
+               COUNT(*) AS Count,
+               ROUND(100.0 * COUNT(*) / (SELECT COUNT(*) FROM Claims), 2) AS Percentage
+        FROM Claims
+        GROUP BY Status;
+    """,
+    "Avg Quantity Claimed per Receiver": """
+        SELECT r.Name, AVG(CAST(f.Quantity AS FLOAT)) AS Avg_Quantity_Claimed
+        FROM Receivers r
+        JOIN Claims c ON r.Receiver_ID = c.Receiver_ID
+        JOIN Food_Listings f ON c.Food_ID = f.Food_ID
+        GROUP BY r.Receiver_ID, r.Name
+        ORDER BY Avg_Quantity_Claimed DESC;
+    """,
+    "Most Claimed Meal Type": """
+        SELECT f.Meal_Type, COUNT(*) AS Claims_Count
+        FROM Food_Listings f
+        JOIN Claims c ON f.Food_ID = c.Food_ID
+        GROUP BY f.Meal_Type
+        ORDER BY Claims_Count DESC;
+    """,
+    "Total Food Donated by Provider": """
+        SELECT p.Name, SUM(f.Quantity) AS Total_Quantity_Donated
+        FROM Providers p
+        JOIN Food_Listings f ON p.Provider_ID = f.Provider_ID
+        GROUP BY p.Provider_ID, p.Name
+        ORDER BY Total_Quantity_Donated DESC;
+    """,
+    "Top Cities by Claimed Food Quantity": """
+        WITH completed AS (
+            SELECT Food_ID, COUNT(*) AS Claims
+            FROM Claims
+            WHERE Status = 'Completed'
+            GROUP BY Food_ID
+        ),
+        ranked AS (
+            SELECT p.City,
+                   SUM(f.Quantity * c.Claims) AS Total_Claimed,
+                   ROW_NUMBER() OVER (ORDER BY SUM(f.Quantity * c.Claims) DESC) AS rn
+            FROM completed c
+            JOIN Food_Listings f ON f.Food_ID = c.Food_ID
+            JOIN Providers p ON p.Provider_ID = f.Provider_ID
             GROUP BY p.City
-            ORDER BY Total_Claimed DESC
-            LIMIT 5;
-        """,
-        "Providers with Most Food Listings": """
-            SELECT p.Name, COUNT(f.Food_ID) AS Listings_Count
-            FROM Providers p
-            JOIN Food_Listings f ON p.Provider_ID = f.Provider_ID
-            GROUP BY p.Provider_ID, p.Name
-            ORDER BY Listings_Count DESC
-            LIMIT 5;
-        """,
-        "Expired or Soon-to-Expire Food Items": """
-            SELECT Food_Name, Quantity, Expiry_Date, Location
-            FROM Food_Listings
-            WHERE Expiry_Date <= DATE_ADD(CURRENT_DATE, INTERVAL 2 DAY)
-            ORDER BY Expiry_Date ASC;
-        """
-    }
-    
-    def safe_create_chart(chart_func, df, **kwargs):
-        """Safely create charts with comprehensive error handling for cloud environments"""
-        if not PLOTLY_AVAILABLE:
-            print("Plotly not available in this environment - charts disabled")
+        )
+        SELECT City, Total_Claimed
+        FROM ranked
+        WHERE rn <= 5
+        ORDER BY rn;
+    """,
+    "Providers with Most Food Listings": """
+        SELECT p.Name, COUNT(f.Food_ID) AS Listings_Count
+        FROM Providers p
+        JOIN Food_Listings f ON p.Provider_ID = f.Provider_ID
+        GROUP BY p.Provider_ID, p.Name
+        ORDER BY Listings_Count DESC
+        LIMIT 5;
+    """,
+    "Expired or Soon-to-Expire Food Items": """
+        SELECT Food_Name, Quantity, Expiry_Date, Location
+        FROM Food_Listings
+        WHERE Expiry_Date <= DATE_ADD(CURRENT_DATE, INTERVAL 2 DAY)
+        ORDER BY Expiry_Date ASC;
+    """
+}
+
+def safe_create_chart(chart_func, df, **kwargs):
+    """Safely create charts with comprehensive error handling for cloud environments"""
+    if not PLOTLY_AVAILABLE:
+        print("Plotly not available in this environment - charts disabled")
+        return None
+        
+    try:
+        if df is None or df.empty:
+            print("No data available for chart creation")
             return None
-            
-        try:
-            if df is None or df.empty:
-                print("No data available for chart creation")
-                return None
-            
-            # Validate required columns
-            required_cols = kwargs.pop('required_columns', [])
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            if missing_cols:
-                print(f"Missing required columns: {missing_cols}")
-                return None
-            
-            # Clean data for cloud compatibility
-            df_clean = df.copy()
-            
-            # Handle NaN values
-            df_clean = df_clean.fillna(0)
-            
-            # Ensure string columns for categorical data
-            for col in df_clean.columns:
-                if df_clean[col].dtype == 'object':
-                    df_clean[col] = df_clean[col].astype(str)
-            
-            # Create chart with timeout protection
-            fig = chart_func(df_clean, **kwargs)
-            
-            # Cloud-friendly configuration
-            if fig:
-                fig.update_layout(
-                    font_family="Arial, sans-serif",
-                    title_font_size=16,
-                    showlegend=True,
-                    height=400,
-                    margin=dict(l=40, r=40, t=60, b=40)
-                )
-                
-            return fig
-            
-        except Exception as e:
-            print(f"Chart creation failed: {str(e)}")
+        
+        # Validate required columns
+        required_cols = kwargs.pop('required_columns', [])
+        missing_cols = [col for col in required_cols if col not in df.columns]
+        if missing_cols:
+            print(f"Missing required columns: {missing_cols}")
             return None
-    
-    # Chart configurations with proper colors for cloud compatibility
-    charts = {
-        "Providers & Receivers by City": lambda df: safe_create_chart(
-            px.bar, df,
-            x='City', y=['Providers_Count','Receivers_Count'], 
-            barmode='group', 
-            title="Providers and Receivers by City",
-            color_discrete_sequence=['#FF6B6B', '#4ECDC4'],
-            required_columns=['City', 'Providers_Count', 'Receivers_Count']
-        ),
-        "Top Food Provider Type by Quantity": lambda df: safe_create_chart(
-            px.bar, df,
-            x='Type', y='Total_Quantity', 
-            title="Food Provider Types by Quantity",
-            color='Type',
-            color_discrete_sequence=['#FF9F43', '#10AC84', '#EE5A24', '#0652DD', '#9C88FF'],
-            required_columns=['Type', 'Total_Quantity']
-        ),
-        "Top Receivers by Claimed Food": lambda df: safe_create_chart(
-            px.bar, df.head(10),  # Limit for performance
-            x='Name', y='Total_Claimed', 
-            title="Top Receivers by Claimed Food",
-            color='Name',
-            color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57', '#FF9FF3', '#54A0FF', '#5F27CD', '#00D2D3', '#FF9F43'],
-            required_columns=['Name', 'Total_Claimed']
-        ),
-        "Top Food Types Available": lambda df: safe_create_chart(
-            px.bar, df,
-            x='Food_Type', y='Count', 
-            title="Top Food Types Available",
-            color='Food_Type',
-            color_discrete_sequence=['#A8E6CF', '#FFD93D', '#FF6B6B', '#4ECDC4', '#45B7D1'],
-            required_columns=['Food_Type', 'Count']
-        ),
-        "Avg Quantity Claimed per Receiver": lambda df: safe_create_chart(
-            px.bar, df.head(15),  # Limit for readability
-            x='Name', y='Avg_Quantity_Claimed',
-            title="Average Quantity Claimed per Receiver",
-            color='Name',
-            color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57', '#FF9FF3', '#54A0FF', '#5F27CD', '#00D2D3', '#FF9F43', '#0652DD', '#9C88FF', '#EE5A24', '#10AC84', '#FF7675'],
-            required_columns=['Name', 'Avg_Quantity_Claimed']
-        ),
-        "Claims Status Percentage": lambda df: safe_create_chart(
-            px.pie, df,
-            names='Status', values='Percentage', 
-            title="Claims Status Distribution",
-            color_discrete_sequence=['#00B894', '#FDCB6E', '#E17055', '#74B9FF'],
-            required_columns=['Status', 'Percentage']
-        ),
-        "Claims Count per Food Item": lambda df: safe_create_chart(
-            px.bar, df.head(20),  # Limit for performance
-            x='Food_Name', y='Claims_Count',
-            title="Claims Count per Food Item",
-            color='Food_Name',
-            color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57', '#FF9FF3', '#54A0FF', '#5F27CD', '#00D2D3', '#FF9F43', '#0652DD', '#9C88FF', '#EE5A24', '#10AC84', '#FF7675', '#A8E6CF', '#FFD93D', '#DDA0DD', '#98D8C8', '#F7DC6F'],
-            required_columns=['Food_Name', 'Claims_Count']
-        ),
-        "Most Claimed Meal Type": lambda df: safe_create_chart(
-            px.bar, df,
-            x='Meal_Type', y='Claims_Count', 
-            title="Most Claimed Meal Types",
-            color='Meal_Type',
-            color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57'],
-            required_columns=['Meal_Type', 'Claims_Count']
-        ),
-        "Total Food Donated by Provider": lambda df: safe_create_chart(
-            px.bar, df.head(15),  # Limit for performance
-            x='Name', y='Total_Quantity_Donated', 
-            title="Total Food Donated by Provider",
-            color='Name',
-            color_discrete_sequence=['#E74C3C', '#3498DB', '#2ECC71', '#F39C12', '#9B59B6', '#1ABC9C', '#E67E22', '#34495E', '#16A085', '#27AE60', '#2980B9', '#8E44AD', '#F1C40F', '#E74C3C', '#95A5A6'],
-            required_columns=['Name', 'Total_Quantity_Donated']
-        ),
-        "Top Cities by Claimed Food Quantity": lambda df: safe_create_chart(
-            px.bar, df,
-            x='City', y='Total_Claimed', 
-            title="Top Cities by Claimed Food Quantity",
-            color='City',
-            color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57'],
-            required_columns=['City', 'Total_Claimed']
-        ),
-        "Providers with Most Food Listings": lambda df: safe_create_chart(
-            px.bar, df,
-            x='Name', y='Listings_Count', 
-            title="Providers with Most Food Listings",
-            color='Name',
-            color_discrete_sequence=['#FF9F43', '#10AC84', '#EE5A24', '#0652DD', '#9C88FF'],
-            required_columns=['Name', 'Listings_Count']
-        ),
-        "Expired or Soon-to-Expire Food Items": lambda df: safe_create_chart(
-            px.bar, df.head(20),  # Limit for performance
-            x='Food_Name', y='Quantity', 
-            title="Expired or Soon-to-Expire Food Items",
-            color='Food_Name',
-            color_discrete_sequence=['#FF4757', '#FF6348', '#FF7675', '#FD79A8', '#FDCB6E', '#F39C12', '#E17055', '#D63031', '#E84393', '#A29BFE', '#6C5CE7', '#74B9FF', '#0984E3', '#00B894', '#00CEC9', '#55A3FF', '#26DE81', '#FD79A8', '#FF9FF3', '#FF6B9D'],
-            required_columns=['Food_Name', 'Quantity']
-        )
-    }
+        
+        # Clean data for cloud compatibility
+        df_clean = df.copy()
+        
+        # Handle NaN values (Arrow-backed string columns cannot be filled with 0)
+        num_cols = df_clean.select_dtypes("number").columns
+        df_clean[num_cols] = df_clean[num_cols].fillna(0)
+        
+        # Ensure string columns for categorical data
+        for col in df_clean.columns:
+            if df_clean[col].dtype == 'object' or pd.api.types.is_string_dtype(df_clean[col]):
+                df_clean[col] = df_clean[col].astype(str)
+        
+        # Create chart with timeout protection
+        fig = chart_func(df_clean, **kwargs)
+        
+        # Cloud-friendly configuration
+        if fig:
+            fig.update_layout(
+                font_family="Arial, sans-serif",
+                title_font_size=16,
+                showlegend=True,
+                height=400,
+                margin=dict(l=40, r=40, t=60, b=40)
+            )
+            
+        return fig
+        
+    except Exception as e:
+        print(f"Chart creation failed: {str(e)}")
+        return None
+
+# Chart configurations with proper colors for cloud compatibility
+_CHARTS = {
+    "Providers & Receivers by City": lambda df: safe_create_chart(
+        px.bar, df,
+        x='City', y=['Providers_Count','Receivers_Count'], 
+        barmode='group', 
+        title="Providers and Receivers by City",
+        color_discrete_sequence=['#FF6B6B', '#4ECDC4'],
+        required_columns=['City', 'Providers_Count', 'Receivers_Count']
+    ),
+    "Top Food Provider Type by Quantity": lambda df: safe_create_chart(
+        px.bar, df,
+        x='Type', y='Total_Quantity', 
+        title="Food Provider Types by Quantity",
+        color='Type',
+        color_discrete_sequence=['#FF9F43', '#10AC84', '#EE5A24', '#0652DD', '#9C88FF'],
+        required_columns=['Type', 'Total_Quantity']
+    ),
+    "Top Receivers by Claimed Food": lambda df: safe_create_chart(
+        px.bar, df.head(10),  # Limit for performance
+        x='Name', y='Total_Claimed', 
+        title="Top Receivers by Claimed Food",
+        color='Name',
+        color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57', '#FF9FF3', '#54A0FF', '#5F27CD', '#00D2D3', '#FF9F43'],
+        required_columns=['Name', 'Total_Claimed']
+    ),
+    "Top Food Types Available": lambda df: safe_create_chart(
+        px.bar, df,
+        x='Food_Type', y='Count', 
+        title="Top Food Types Available",
+        color='Food_Type',
+        color_discrete_sequence=['#A8E6CF', '#FFD93D', '#FF6B6B', '#4ECDC4', '#45B7D1'],
+        required_columns=['Food_Type', 'Count']
+    ),
+    "Avg Quantity Claimed per Receiver": lambda df: safe_create_chart(
+        px.bar, df.head(15),  # Limit for readability
+        x='Name', y='Avg_Quantity_Claimed',
+        title="Average Quantity Claimed per Receiver",
+        color='Name',
+        color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57', '#FF9FF3', '#54A0FF', '#5F27CD', '#00D2D3', '#FF9F43', '#0652DD', '#9C88FF', '#EE5A24', '#10AC84', '#FF7675'],
+        required_columns=['Name', 'Avg_Quantity_Claimed']
+    ),
+    "Claims Status Percentage": lambda df: safe_create_chart(
+        px.pie, df,
+        names='Status', values='Percentage', 
+        title="Claims Status Distribution",
+        color_discrete_sequence=['#00B894', '#FDCB6E', '#E17055', '#74B9FF'],
+        required_columns=['Status', 'Percentage']
+    ),
+    "Claims Count per Food Item": lambda df: safe_create_chart(
+        px.bar, df.head(20),  # Limit for performance
+        x='Food_Name', y='Claims_Count',
+        title="Claims Count per Food Item",
+        color='Food_Name',
+        color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57', '#FF9FF3', '#54A0FF', '#5F27CD', '#00D2D3', '#FF9F43', '#0652DD', '#9C88FF', '#EE5A24', '#10AC84', '#FF7675', '#A8E6CF', '#FFD93D', '#DDA0DD', '#98D8C8', '#F7DC6F'],
+        required_columns=['Food_Name', 'Claims_Count']
+    ),
+    "Most Claimed Meal Type": lambda df: safe_create_chart(
+        px.bar, df,
+        x='Meal_Type', y='Claims_Count', 
+        title="Most Claimed Meal Types",
+        color='Meal_Type',
+        color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57'],
+        required_columns=['Meal_Type', 'Claims_Count']
+    ),
+    "Total Food Donated by Provider": lambda df: safe_create_chart(
+        px.bar, df.head(15),  # Limit for performance
+        x='Name', y='Total_Quantity_Donated', 
+        title="Total Food Donated by Provider",
+        color='Name',
+        color_discrete_sequence=['#E74C3C', '#3498DB', '#2ECC71', '#F39C12', '#9B59B6', '#1ABC9C', '#E67E22', '#34495E', '#16A085', '#27AE60', '#2980B9', '#8E44AD', '#F1C40F', '#E74C3C', '#95A5A6'],
+        required_columns=['Name', 'Total_Quantity_Donated']
+    ),
+    "Top Cities by Claimed Food Quantity": lambda df: safe_create_chart(
+        px.bar, df,
+        x='City', y='Total_Claimed', 
+        title="Top Cities by Claimed Food Quantity",
+        color='City',
+        color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57'],
+        required_columns=['City', 'Total_Claimed']
+    ),
+    "Providers with Most Food Listings": lambda df: safe_create_chart(
+        px.bar, df,
+        x='Name', y='Listings_Count', 
+        title="Providers with Most Food Listings",
+        color='Name',
+        color_discrete_sequence=['#FF9F43', '#10AC84', '#EE5A24', '#0652DD', '#9C88FF'],
+        required_columns=['Name', 'Listings_Count']
+    ),
+    "Expired or Soon-to-Expire Food Items": lambda df: safe_create_chart(
+        px.bar, df.head(20),  # Limit for performance
+        x='Food_Name', y='Quantity', 
+        title="Expired or Soon-to-Expire Food Items",
+        color='Food_Name',
+        color_discrete_sequence=['#FF4757', '#FF6348', '#FF7675', '#FD79A8', '#FDCB6E', '#F39C12', '#E17055', '#D63031', '#E84393', '#A29BFE', '#6C5CE7', '#74B9FF', '#0984E3', '#00B894', '#00CEC9', '#55A3FF', '#26DE81', '#FD79A8', '#FF9FF3', '#FF6B9D'],
+        required_columns=['Food_Name', 'Quantity']
+    )
+}
+
+def analysis_query(option, param=None):
+    """Run an analysis query and return its dataframe - Cloud Compatible Version"""
     
     # Execute query with error handling
-    if option not in queries:
+    if option not in _QUERIES:
         print(f"Query option '{option}' not found")
-        return None, None
+        return None
     
     try:
         # Execute the query
-        df = run_query(queries[option], params=(param,) if param else None)
+        df = run_query(_QUERIES[option], params=(param,) if param else None)
         
         if df is None:
             print(f"Query returned None for option: {option}")
-            return None, None
+            return None
             
         print(f"Query '{option}' executed successfully")
         print(f"Returned {len(df)} rows with columns: {list(df.columns)}")
-        
-        # Create chart if configuration exists
-        fig = None
-        if option in charts and not df.empty:
-            print(f"Creating chart for: {option}")
-            fig = charts[option](df)
-            if fig is None:
-                print("Chart creation returned None")
-        else:
-            if df.empty:
-                print("DataFrame is empty - no chart created")
-            else:
-                print("No chart configuration available for this query")
-        
-        return df, fig
+        return df
         
     except Exception as e:
         print(f"Error in analysis_query for '{option}': {str(e)}")
         import traceback
         traceback.print_exc()
-        return None, None
+        return None
+
+@st.cache_data(ttl=600, show_spinner=False)
+def all_analyses_cached():
+    """Run every parameterless analysis query in parallel over the connection pool."""
+    return run_queries_concurrently({option: query for option, query in _QUERIES.items() if "%s" not in query})
+
+def all_analyses():
+    """All analysis results, {option: DataFrame or None}; a run with failures is not kept cached."""
+    results = all_analyses_cached()
+    if any(df is None for df in results.values()):
+        # Don't serve one transient error to every session for the whole ttl
+        all_analyses_cached.clear()
+    return results
+
+MAX_CHART_ROWS = 30
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def build_figure(option, df):
+    """Build the chart for an analysis result, memoized on the option and data.
+
+    Only the first MAX_CHART_ROWS rows are plotted to keep the figure payload small.
+    """
+    if option not in _CHARTS:
+        print("No chart configuration available for this query")
+        return None
+    if df is None or df.empty:
+        print("DataFrame is empty - no chart created")
+        return None
+    
+    print(f"Creating chart for: {option}")
+    fig = _CHARTS[option](df.head(MAX_CHART_ROWS))
+    if fig is None:
+        print("Chart creation returned None")
+    return fig
+
+
+# ---------------- Contact Lookup ----------------
+# Entity type -> (table, ID column, contact columns); also whitelists what goes into the SQL
+CONTACT_TABLES = {
+    "Provider": ("Providers", "Provider_ID", ("Name", "Contact", "Address")),
+    "Receiver": ("Receivers", "Receiver_ID", ("Name", "Type", "City"))
+}
+
+# Contact loader statements, built once at import instead of per call
+CONTACT_QUERIES = {
+    entity: text(f"SELECT {pk}, {', '.join(columns)} FROM {table}")
+    for entity, (table, pk, columns) in CONTACT_TABLES.items()
+}
+
+@st.cache_data(persist="disk", max_entries=8, show_spinner=False)
+def load_contacts_cached(entity, data_version, hour):
+    """Load all contacts of one entity type as {ID: (contact values)} in a single query.
+
+    Persisted to disk so restarts start warm. Streamlit ignores ttl for
+    persisted caches, so data_version and hour are part of the key instead;
+    clear_query_cache() also deletes the files.
+    Errors are raised instead of returned so that failures are never cached.
+    """
+    # Plain tuples: no DataFrame is built for what is only ever a one-row lookup
+    with get_engine().connect() as conn:
+        rows = conn.execute(CONTACT_QUERIES[entity]).all()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+@st.cache_resource
+def _contacts_hour():
+    """Process-wide record of the hour whose contact snapshots are on disk."""
+    return {"value": int(time.time() // 3600)}
+
+def load_contacts(entity):
+    """Cached contacts, at most an hour old and never older than the last in-app write."""
+    hour = int(time.time() // 3600)
+    state = _contacts_hour()
+    if state["value"] != hour:
+        # max_entries only bounds the in-memory layer; drop past hours' files from disk
+        load_contacts_cached.clear()
+        state["value"] = hour
+    return load_contacts_cached(entity, _data_version()["value"], hour)
+
+def parse_ids(raw):
+    """Parse a comma-separated ID list into unique positive ints, or None if any entry is invalid."""
+    tokens = [token.strip() for token in raw.split(",") if token.strip()]
+    # isdecimal, not isdigit: superscripts such as "²" pass isdigit but make int() raise
+    if not all(token.isdecimal() and int(token) > 0 for token in tokens):
+        return None
+    return tuple(dict.fromkeys(int(token) for token in tokens))
+
+def get_contacts(entity, ids):
+    """Contact details for several IDs from the cached contact table.
+
+    Returns ({ID: contact tuple} for the IDs found, [IDs not found]).
+    """
+    contacts = load_contacts(entity)
+    found = {i: contacts[i] for i in ids if i in contacts}
+    return found, [i for i in ids if i not in found]
 
 
 # Additional helper function for cloud environments
@@ -546,26 +973,10 @@ def check_environment():
         print("✗ Numpy not available")
     
     return libraries
-# ---------------- Streamlit UI ----------------
-st.set_page_config(page_title="Food Wastage Management System", layout="wide")
-
-# ---------------- Helper Function for Centered Headers ----------------
-def centered_header(text, level=1, emoji=""):
-    st.markdown(f"<h{level} style='text-align:center;'>{emoji} {text}</h{level}>", unsafe_allow_html=True)
 
-# Check database connection at startup
-if not test_db_connection():
-    st.error("Cannot connect to database. Please check your configuration.")
-    st.info("""
-    **For Streamlit Cloud deployment, you need to:**
-    1. Set up a cloud MySQL database (e.g., PlanetScale, Railway, or AWS RDS)
-    2. Configure secrets in Streamlit Cloud with your database credentials
-    3. Make sure your database tables are created and populated
-    """)
-    st.stop()
-
-# Consolidated CSS styling
-st.markdown("""
+# ---------------- Styles ----------------
+# Built once at import; each rerun only passes the same string along
+_APP_CSS = """
 <style>
 .stApp {
     background-image: linear-gradient(rgba(255, 255, 255, 0.7), rgba(255, 255, 255, 0.7)), 
@@ -625,26 +1036,124 @@ h1, h2, h3, h4, h5, h6, p, div, span, label {
     border: 1px solid rgba(0, 0, 0, 0.1);
 }
 
-/* Tab styling */
-.stTabs [data-baseweb="tab-panel"] {
-    background-color: rgba(255, 255, 255, 0.1);
-    border-radius: 10px;
-    padding: 20px;
-    backdrop-filter: blur(5px);
-}
-
 /* Alert styling */
 .stAlert {
     background-color: rgba(255, 255, 255, 0.9);
     border-radius: 5px;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# CSS for CRUD buttons
+_CRUD_BUTTON_CSS = """
+<style>
+.crud-btn button {
+    background-color: #e6f7ff !important;
+    color: #000000 !important;
+    border: 1px solid #91d5ff !important;
+}
+.crud-btn button:hover {
+    background-color: #bae7ff !important;
+}
+</style>
+"""
+
+_PLAYGROUND_CSS = """
+<style>
+div.stButton > button:first-child {
+    background-color: #dff0d8;
+    color: #3c763d;
+    border-radius: 8px;
+    height: 3em;
+    width: 100%;
+    font-size: 16px;
+    font-weight: bold;
+    border: 1px solid #d6e9c6;
+}
+div.stButton > button:hover {
+    background-color: #c8e5bc;
+    color: #2b542c;
+}
+</style>
+"""
+
+_ANALYSIS_CSS = """
+<style>
+div.stButton > button:first-child {
+    background-color: #d9edf7;
+    color: #31708f;
+    border-radius: 8px;
+    height: 3em;
+    width: 100%;
+    font-size: 16px;
+    font-weight: bold;
+    border: 1px solid #bce8f1;
+}
+div.stButton > button:hover {
+    background-color: #c4e3f3;
+    color: #245269;
+}
+</style>
+"""
+
+# ---------------- Static Content ----------------
+# Developer details shown in Tab 7
+DEVELOPER_INFO = {
+    "Name": "Sridevi V",
+    "Role": "AI/ML Intern",
+    "Organization": "Labmentix"
+}
+
+@lru_cache(maxsize=1)
+def about_md():
+    """Tab 7 header, developer info and overview as one Markdown string, built once per process."""
+    developer = "\n\n".join(f"**{field}:** {value}" for field, value in DEVELOPER_INFO.items())
+    return f"""
+<h1 style='text-align:center;'> About the Developer</h1>
+
+### Developer Information
+{developer}
+
+### Project Overview
+This Food Wastage Management System was developed as part of my AI/ML internship at {DEVELOPER_INFO["Organization"]}. The application demonstrates proficiency in database management, web development with Streamlit, and data visualization using modern Python libraries.
+
+### Technologies Used
+"""
+
+# Technologies Used cards as (Streamlit alert method, markdown), one per column
+TECH = (
+    ("info", "**Backend**\n- Python\n- MySQL\n- Pandas"),
+    ("success", "**Frontend**\n- Streamlit\n- HTML/CSS\n- Plotly"),
+    ("warning", "**Features**\n- Filtering\n- CRUD Operations \n- SQL playground and Data Analysis")
+)
+
+# ---------------- Streamlit UI ----------------
+st.set_page_config(page_title="Food Wastage Management System", layout="wide")
+
+# ---------------- Helper Function for Centered Headers ----------------
+def centered_header(text, level=1, emoji=""):
+    st.markdown(f"<h{level} style='text-align:center;'>{emoji} {text}</h{level}>", unsafe_allow_html=True)
+
+# Check database connection at startup
+if not test_db_connection():
+    st.error("Cannot connect to database. Please check your configuration.")
+    st.info("""
+    **For Streamlit Cloud deployment, you need to:**
+    1. Set up a cloud MySQL database (e.g., PlanetScale, Railway, or AWS RDS)
+    2. Configure secrets in Streamlit Cloud with your database credentials
+    3. Make sure your database tables are created and populated
+    """)
+    st.stop()
+
+# Consolidated CSS styling
+st.markdown(_APP_CSS, unsafe_allow_html=True)
 
 # ---------------- Main Application ----------------
 
 # Tab Navigation
-tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
+# A radio instead of st.tabs: st.tabs runs every tab body on each rerun,
+# this renders only the selected section
+TABS = [
     "Introduction",
     "View Table & Filtering",
     "CRUD Operations",
@@ -652,10 +1161,11 @@ tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
     "Data Analysis",
     "Contact Info",
     "User Information"
-])
+]
+active_tab = st.radio("Section", TABS, horizontal=True, key="active_tab", label_visibility="collapsed")
 
 # ---------------- Tab 1: Introduction ----------------
-with tab1:
+if active_tab == "Introduction":
     centered_header("Welcome to Food Wastage Management System")
     
     st.write("""
@@ -675,19 +1185,25 @@ with tab1:
         st.warning("**Contact Management**\n\nThe platform provides easy access to the contact details of both providers and receivers, enabling direct coordination without the need for intermediaries.")
 
 # ---------------- Tab 2: View Table & Filtering ----------------
-with tab2:
+if active_tab == "View Table & Filtering":
     centered_header("View and Filter Tables")
     
     table_name = st.selectbox("Select Table", ['Providers', 'Receivers', 'Food_Listings', 'Claims'])
-    df = fetch_table_data(table_name)
+    if st.button("Refresh Data", key="refresh_tables"):
+        clear_query_cache()
+    # Keep the loaded pages in session state so filter edits skip the cache lookup and copy
+    loaded_key = (table_name, _data_version()["value"])
+    if st.session_state.get("tbl2_key") != loaded_key:
+        first_page = load_table_page(table_name)
+        st.session_state["tbl2_data"] = build_table_view(first_page, first_page)
+        st.session_state["tbl2_key"] = loaded_key
+    df, num_ranges, obj_cols, has_more = st.session_state["tbl2_data"]
 
     if not df.empty:
         st.subheader(f"{table_name} Table Filters")
         
-        filtered_df = df.copy()
-        
-        # Separate columns for object (text) and number filters
-        obj_cols = [col for col in df.columns if df[col].dtype == "object"]
+        # Collect filter inputs first, then let the database apply them
+        text_filters, range_filters = {}, {}
         if obj_cols:
             st.markdown("### Text Filters")
             text_filter_cols = st.columns(3)
@@ -695,69 +1211,65 @@ with tab2:
                 with text_filter_cols[i % 3]:
                     val = st.text_input(f"Filter {col}", key=f"{table_name}_{col}")
                     if val:
-                        filtered_df = filtered_df[filtered_df[col].str.contains(val, case=False, na=False)]
+                        text_filters[col] = val
         
-        num_cols = [col for col in df.columns if df[col].dtype in ["int64", "float64"]]
-        if num_cols:
+        if num_ranges:
             st.markdown("### Numerical Filters")
             num_filter_cols = st.columns(3)
-            for i, col in enumerate(num_cols):
+            for i, (col, (min_val, max_val)) in enumerate(num_ranges.items()):
                 with num_filter_cols[i % 3]:
-                    min_val, max_val = int(df[col].min()), int(df[col].max())
                     if min_val != max_val:
                         range_val = st.slider(f"{col} Range", min_val, max_val, (min_val, max_val), key=f"{table_name}_{col}")
-                        filtered_df = filtered_df[(filtered_df[col] >= range_val[0]) & (filtered_df[col] <= range_val[1])]
+                        if range_val != (min_val, max_val):
+                            range_filters[col] = range_val
+
+        if not (text_filters or range_filters):
+            filtered_df = df
+            summary = f"{len(df)} loaded records"
+        elif not has_more:
+            # The whole table is already loaded, so filter it in memory
+            filtered_df = filter_table_data(df, text_filters, range_filters)
+            summary = f"{len(filtered_df)} of {len(df)} records found"
+        else:
+            # The database searches the whole table; one extra row tells whether matches were cut off
+            max_rows = len(df)
+            filtered_df = fetch_filtered_table_data(table_name, text_filters, range_filters, max_rows + 1)
+            more_matches = len(filtered_df) > max_rows
+            filtered_df = filtered_df.head(max_rows)
+            summary = f"{len(filtered_df)}{'+' if more_matches else ''} matches in the full {table_name} table"
+            if more_matches:
+                summary += f" (showing the first {max_rows}; narrow the filters to see the rest)"
 
         # Display results
-        st.info(f"**Results:** {len(filtered_df)} of {len(df)} records found")
+        st.info(f"**Results:** {summary}")
         st.dataframe(filtered_df, use_container_width=True, height=400)
+
+        # A full last page means there may be more rows on the server
+        if has_more:
+            if st.button("Load More Rows", key=f"{table_name}_load_more"):
+                # Fetch only the next page and append it to the rows already loaded
+                next_page = load_table_page(table_name, offset=len(df))
+                st.session_state["tbl2_data"] = build_table_view(
+                    pd.concat([df, next_page], ignore_index=True), next_page
+                )
+                st.rerun()
     else:
         st.info(f"No data available in {table_name} table.")
 
 # ---------------- Tab 3: CRUD Operations ----------------
-with tab3:
+if active_tab == "CRUD Operations":
     centered_header("CRUD Operations")
 
-    # Table configuration
-    table_fields = {
-        "Food_Listings": ["Food_ID", "Food_Name", "Quantity", "Expiry_Date", "Provider_ID", "Provider_Type", "Location", "Food_Type", "Meal_Type"],
-        "Providers": ["Provider_ID", "Name", "Type", "Contact", "Address", "City"],
-        "Receivers": ["Receiver_ID", "Name", "Contact", "Address", "City"],
-        "Claims": ["Claim_ID", "Food_ID", "Receiver_ID", "Status", "Claim_Date"]
-    }
-    
-    primary_keys = {
-        "Food_Listings": "Food_ID",
-        "Providers": "Provider_ID",
-        "Receivers": "Receiver_ID",
-        "Claims": "Claim_ID"
-    }
-
     col1, col2 = st.columns([1, 1])
     with col1:
-        table_name = st.selectbox("Select Table", list(table_fields.keys()))
+        table_name = st.selectbox("Select Table", list(TABLE_FIELDS.keys()))
     with col2:
-        crud_action = st.selectbox("Select Action", ["Create", "Update", "Delete"])
-
-    fields = table_fields[table_name]
-    pk = primary_keys[table_name]
-
-    # Add CSS for CRUD buttons
-    st.markdown(
-        """
-        <style>
-        .crud-btn button {
-            background-color: #e6f7ff !important;
-            color: #000000 !important;
-            border: 1px solid #91d5ff !important;
-        }
-        .crud-btn button:hover {
-            background-color: #bae7ff !important;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+        crud_action = st.selectbox("Select Action", ["Create", "Bulk Create", "Update", "Delete"])
+
+    fields = TABLE_FIELDS[table_name]
+    pk = PRIMARY_KEYS[table_name]
+
+    st.markdown(_CRUD_BUTTON_CSS, unsafe_allow_html=True)
 
     if crud_action == "Create":
         st.subheader(f"Create New {table_name} Record")
@@ -771,7 +1283,8 @@ with tab3:
                     elif "Date" in field:
                         inputs[field] = st.date_input(field)
                     else:
-                        inputs[field] = st.text_input(field)
+                        hint = "YYYY-MM-DD HH:MM" if field in TIMESTAMP_FIELDS.get(table_name, ()) else None
+                        inputs[field] = st.text_input(field, placeholder=hint)
             
             with st.container():
                 st.markdown('<div class="crud-btn">', unsafe_allow_html=True)
@@ -780,6 +1293,31 @@ with tab3:
                     st.rerun()
                 st.markdown('</div>', unsafe_allow_html=True)
 
+    elif crud_action == "Bulk Create":
+        st.subheader(f"Bulk Create {table_name} Records")
+        st.info(f"Upload a CSV file whose header uses {table_name} columns: {', '.join(fields)}")
+        uploaded_file = st.file_uploader("CSV file", type="csv", key=f"bulk_{table_name}")
+        
+        bulk_df = None
+        if uploaded_file is not None:
+            try:
+                bulk_df = pd.read_csv(uploaded_file)
+            except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError) as e:
+                st.error(f"Could not read CSV file: {e}")
+        
+        if bulk_df is not None:
+            unknown_cols = [col for col in bulk_df.columns if col not in fields]
+            if unknown_cols:
+                st.error(f"Unknown columns for {table_name}: {', '.join(unknown_cols)}")
+            else:
+                st.dataframe(bulk_df.head(), use_container_width=True)
+                
+                st.markdown('<div class="crud-btn">', unsafe_allow_html=True)
+                if st.button(f"Create {len(bulk_df)} Records", use_container_width=True):
+                    create_records(table_name, bulk_df)
+                    st.rerun()
+                st.markdown('</div>', unsafe_allow_html=True)
+
     elif crud_action == "Update":
         st.subheader(f"Update {table_name} Record")
         with st.form(f"update_{table_name}"):
@@ -797,7 +1335,8 @@ with tab3:
                     elif "Date" in field:
                         inputs[field] = st.date_input(field)
                     else:
-                        inputs[field] = st.text_input(field)
+                        hint = "YYYY-MM-DD HH:MM" if field in TIMESTAMP_FIELDS.get(table_name, ()) else None
+                        inputs[field] = st.text_input(field, placeholder=hint)
             
             st.markdown('<div class="crud-btn">', unsafe_allow_html=True)
             if st.form_submit_button("Update Record", use_container_width=True):
@@ -818,25 +1357,8 @@ with tab3:
             st.markdown('</div>', unsafe_allow_html=True)
 
 # ---------------- Tab 4: SQL Playground ----------------
-with tab4:
-    st.markdown("""
-    <style>
-    div.stButton > button:first-child {
-        background-color: #dff0d8;
-        color: #3c763d;
-        border-radius: 8px;
-        height: 3em;
-        width: 100%;
-        font-size: 16px;
-        font-weight: bold;
-        border: 1px solid #d6e9c6;
-    }
-    div.stButton > button:hover {
-        background-color: #c8e5bc;
-        color: #2b542c;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+if active_tab == "SQL playground":
+    st.markdown(_PLAYGROUND_CSS, unsafe_allow_html=True)
 
     centered_header("SQL Playground")
 
@@ -882,46 +1404,12 @@ with tab4:
                     st.error(f"Error executing query: {e}")
 
 # ---------------- Tab 5: Data Analysis ----------------
-with tab5:
-    st.markdown("""
-    <style>
-    div.stButton > button:first-child {
-        background-color: #d9edf7;
-        color: #31708f;
-        border-radius: 8px;
-        height: 3em;
-        width: 100%;
-        font-size: 16px;
-        font-weight: bold;
-        border: 1px solid #bce8f1;
-    }
-    div.stButton > button:hover {
-        background-color: #c4e3f3;
-        color: #245269;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+if active_tab == "Data Analysis":
+    st.markdown(_ANALYSIS_CSS, unsafe_allow_html=True)
 
     centered_header("Data Analysis Dashboard")
 
-    query_options = [
-        "Providers & Receivers by City",
-        "Top Food Provider Type by Quantity",
-        "Provider Contact Info by City",
-        "Top Receivers by Claimed Food",
-        "Total Food Quantity Available",
-        "City with Most Food Listings",
-        "Top Food Types Available",
-        "Claims Count per Food Item",
-        "Top Provider by Successful Claims",
-        "Claims Status Percentage",
-        "Avg Quantity Claimed per Receiver",
-        "Most Claimed Meal Type",
-        "Total Food Donated by Provider",
-        "Top Cities by Claimed Food Quantity",
-        "Providers with Most Food Listings",
-        "Expired or Soon-to-Expire Food Items"
-    ]
+    query_options = list(_QUERIES)
 
     col1, col2 = st.columns([2, 1])
     with col1:
@@ -933,69 +1421,90 @@ with tab5:
 
     if st.button("Run Analysis", use_container_width=True):
         with st.spinner("Running analysis..."):
-            df, fig = analysis_query(selected_query, param)
+            df = analysis_query(selected_query, param)
 
             if df is not None and not df.empty:
                 st.subheader("Results")
                 st.dataframe(df, use_container_width=True)
 
+                # Build the chart only after the table is on screen
+                fig = build_figure(selected_query, df)
                 if fig is not None:
                     st.plotly_chart(fig, use_container_width=True)
             else:
                 st.warning("No data found for the selected query.")
 
+    if st.button("Run All Analyses", use_container_width=True):
+        with st.spinner("Running all analyses..."):
+            for option, df in all_analyses().items():
+                with st.expander(option):
+                    if df is None:
+                        st.error("Query failed; it will be retried on the next run.")
+                    elif not df.empty:
+                        st.dataframe(df, use_container_width=True)
+                        fig = build_figure(option, df)
+                        if fig is not None:
+                            st.plotly_chart(fig, use_container_width=True)
+                    else:
+                        st.warning("No data found for this query.")
+
+    if st.button("Refresh Data", key="refresh_analysis", use_container_width=True):
+        clear_query_cache()
+
 # ---------------- Tab 6: Contact Info ----------------
-with tab6:
-    centered_header("Contact Information")
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        entity = st.selectbox("Select Entity Type", ["Provider", "Receiver"])
-    with col2:
-        entity_id = st.number_input(f"Enter {entity} ID", min_value=1, step=1)
+@st.fragment
+def contact_lookup_fragment():
+    """Contact lookup; submitting it reruns only this fragment, not the whole app."""
+    # The form reruns once on submit rather than on every input change
+    with st.form("contact_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            entity = st.selectbox("Select Entity Type", list(CONTACT_TABLES))
+        with col2:
+            raw_ids = st.text_input("Enter IDs (comma-separated)", placeholder="e.g. 1, 5, 12")
+        submitted = st.form_submit_button("Get Contact Info", use_container_width=True)
     
-    if st.button("Get Contact Info", use_container_width=True):
-        if entity == "Provider":
-            query = "SELECT Name, Contact, Address FROM Providers WHERE Provider_ID = %s"
-        else:
-            query = "SELECT Name, Type, City FROM Receivers WHERE Receiver_ID = %s"
+    if submitted:
+        # Reject bad IDs before spending a database round trip on them
+        ids = parse_ids(raw_ids)
+        if not ids:
+            st.warning("Enter one or more valid IDs, separated by commas")
+            return
         
-        df = run_query(query, params=(entity_id,))
+        # Per-session memo of the last lookup; the data version invalidates it after writes
+        lookup_key = (entity, ids, _data_version()["value"])
+        try:
+            if st.session_state.get("contact_key") != lookup_key:
+                st.session_state["contact_data"] = get_contacts(entity, ids)
+                st.session_state["contact_key"] = lookup_key
+            found, missing = st.session_state["contact_data"]
+        except Exception as e:
+            st.error(f"Query execution failed: {e}")
+            return
         
-        if not df.empty:
+        if found:
             st.subheader("Contact Details")
-            st.dataframe(df, use_container_width=True)
-        else:
-            st.error(f"No {entity} found with ID {entity_id}")
-
-# ---------------- Tab 7: User Information ----------------
-with tab7:
-    centered_header("About the Developer")
+            # Build the result as Arrow directly; Streamlit ships Arrow to the browser
+            _, pk, columns = CONTACT_TABLES[entity]
+            values = zip(*found.values())
+            st.table(pa.table({pk: list(found), **{col: list(v) for col, v in zip(columns, values)}}))
+        if missing:
+            st.error(f"No {entity} found with ID(s) {', '.join(map(str, missing))}")
+
+if active_tab == "Contact Info":
+    centered_header("Contact Information")
+    contact_lookup_fragment()
 
-    # Developer Information
-    st.subheader("Developer Information")
-    st.write("**Name:** Sridevi V")
-    st.write("**Role:** AI/ML Intern")
-    st.write("**Organization:** Labmentix")
+    if st.button("Refresh Data", key="refresh_contacts", use_container_width=True):
+        clear_query_cache()
 
-    # Project Overview
-    st.subheader("Project Overview")
-    st.write("""
-    This Food Wastage Management System was developed as part of my AI/ML internship at Labmentix. The application demonstrates proficiency in database management, web development with Streamlit, and data visualization using modern Python libraries.
-    """)
+# ---------------- Tab 7: User Information ----------------
+if active_tab == "User Information":
+    st.markdown(about_md(), unsafe_allow_html=True)
 
     # Technologies Used
-    st.subheader("Technologies Used")
-    tech_cols = st.columns(3)
-
-    with tech_cols[0]:
-        st.info("**Backend**\n- Python\n- MySQL\n- Pandas")
-
-    with tech_cols[1]:
-        st.success("**Frontend**\n- Streamlit\n- HTML/CSS\n- Plotly")
-
-    with tech_cols[2]:
-        st.warning("**Features**\n- Filtering\n- CRUD Operations \n- SQL playground and Data Analysis")
+    for (kind, md), col in zip(TECH, st.columns(len(TECH))):
+        getattr(col, kind)(md)
 
 
 
@@ -0,0 +1,17 @@
+-- Cascade claim deletes from Food_Listings to Claims.
+--
+-- With this constraint in place, the database itself removes a food listing's
+-- claims, including on deletes made outside the app. The app detects the
+-- constraint in information_schema and then issues a single DELETE; without it,
+-- the app deletes the claims first in the same transaction.
+--
+-- If Claims already has a foreign key on Food_ID, drop it first
+-- (SHOW CREATE TABLE Claims shows its name):
+--   ALTER TABLE Claims DROP FOREIGN KEY <constraint_name>;
+-- Adding the constraint fails while Claims holds rows whose Food_ID has no
+-- matching listing; those rows have to be removed or fixed beforehand.
+
+ALTER TABLE Claims
+    ADD CONSTRAINT fk_claims_food_listing
+    FOREIGN KEY (Food_ID) REFERENCES Food_Listings (Food_ID)
+    ON DELETE CASCADE;
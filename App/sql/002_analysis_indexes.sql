@@ -0,0 +1,43 @@
+-- Secondary indexes for the Data Analysis queries.
+--
+-- Check a plan before and after with EXPLAIN ANALYZE <query>.
+--
+-- Clustered primary keys: the notes below assume each table's integer ID
+-- primary key is CLUSTERED, i.e. rows are stored keyed by the primary key.
+-- * MySQL/InnoDB always clusters on the primary key.
+-- * TiDB (the README's TiDB Cloud target) clusters a single-column integer
+--   primary key under the default tidb_enable_clustered_index = INT_ONLY
+--   (or ON). Tables created with NONCLUSTERED, or while the variable was OFF,
+--   are not clustered. SHOW CREATE TABLE <table> prints
+--   /*T![clustered_index] CLUSTERED */ on the primary key when it is.
+-- If a table is not clustered, an ID lookup reads the primary-key index and
+-- then the row, so a covering index as described below can be worth adding.
+--
+-- Food_Listings(Food_ID, Quantity) is deliberately not added. With a
+-- clustered Food_ID primary key, Quantity is already stored with the key.
+
+-- Top Receivers by Claimed Food / Avg Quantity Claimed per Receiver:
+-- group claims by receiver without touching the Claims rows
+CREATE INDEX ix_claims_recv_food ON Claims (Receiver_ID, Food_ID);
+
+-- Top Cities by Claimed Food Quantity / Top Provider by Successful Claims:
+-- collapse completed claims per food item from the index alone
+CREATE INDEX ix_claims_status_food ON Claims (Status, Food_ID);
+
+-- Top Food Provider Type, Total Food Donated, Providers with Most Listings:
+-- join and sum listings per provider from the index alone
+CREATE INDEX ix_fl_provider_qty ON Food_Listings (Provider_ID, Quantity);
+
+-- Providers & Receivers by City, Provider Contact Info by City
+CREATE INDEX ix_prov_city ON Providers (City);
+CREATE INDEX ix_recv_city ON Receivers (City);
+
+-- Contact lookup (Contact Info tab): no covering index is added.
+-- Provider_ID and Receiver_ID are the primary keys. With clustered primary
+-- keys (see the note at the top), a lookup by ID, or the app's full
+-- prefetch of the contact columns, already reads the rows straight from the
+-- clustered primary key, so a secondary (ID, Name, Contact, ...) index would
+-- duplicate the table.
+-- On a NONCLUSTERED table, this index would make those reads index-only:
+--   CREATE INDEX ix_prov_contact ON Providers (Provider_ID, Name, Contact, Address);
+--   CREATE INDEX ix_recv_contact ON Receivers (Receiver_ID, Name, Type, City);